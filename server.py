@@ -13,6 +13,7 @@ sys.path.insert(0, os.path.dirname(__file__))
 
 from mcp.server.fastmcp import FastMCP
 
+from src.master_service import close_master_service
 from src.tools.master_tools import register_master_tools
 
 # 로깅 설정
@@ -50,6 +51,14 @@ register_master_tools(mcp)
 logger.info("종목코드 검색 MCP 서버 초기화 완료")
 
 
+async def main():
+    """서버 실행 (종료 시 공유 HTTP 클라이언트 정리)"""
+    try:
+        await mcp.run_streamable_http_async()
+    finally:
+        await close_master_service()
+
+
 if __name__ == "__main__":
     logger.info("서버 시작: http://0.0.0.0:8000/mcp")
-    mcp.run(transport="streamable-http")
+    asyncio.run(main())
@@ -3,20 +3,27 @@
 한국투자증권 마스터파일을 다운로드하고 파싱하여 종목 검색 기능 제공
 """
 
+import asyncio
+import codecs
+import csv
+import io
 import os
 import logging
+import threading
 import zipfile
 from datetime import datetime, date
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Optional
 from dataclasses import dataclass, field
 
 import httpx
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DataRange:
     """데이터 보유 기간"""
 
@@ -25,7 +32,7 @@ class DataRange:
     days: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ExchangeStatus:
     """거래소 상태"""
 
@@ -34,7 +41,7 @@ class ExchangeStatus:
     file_exists: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class MasterStatus:
     """마스터파일 상태"""
 
@@ -43,7 +50,7 @@ class MasterStatus:
     update_check_date: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExchangeInfo:
     """거래소 정보"""
 
@@ -52,7 +59,7 @@ class ExchangeInfo:
     country: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ExchangeListResponse:
     """거래소 목록"""
 
@@ -60,7 +67,7 @@ class ExchangeListResponse:
     overseas: list[ExchangeInfo]
 
 
-@dataclass
+@dataclass(slots=True)
 class MasterUpdateResponse:
     """마스터파일 업데이트 결과"""
 
@@ -70,7 +77,7 @@ class MasterUpdateResponse:
     errors: dict[str, str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SymbolSearchItem:
     """검색 결과 항목"""
 
@@ -83,7 +90,7 @@ class SymbolSearchItem:
     data_range: DataRange | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SymbolSearchResult:
     """검색 결과"""
 
@@ -93,7 +100,7 @@ class SymbolSearchResult:
     items: list[SymbolSearchItem]
 
 
-@dataclass
+@dataclass(slots=True)
 class SymbolDetail:
     """종목 상세 정보"""
 
@@ -109,6 +116,90 @@ class SymbolDetail:
     data_range: DataRange | None = None
 
 
+def _read_csv_row(line: bytes) -> list[str]:
+    """CSV 한 행 파싱 (따옴표/쉼표가 포함된 필드 처리)"""
+    return next(csv.reader([line.decode("utf-8-sig")]), [])
+
+
+def _write_replace(path: str, write: Callable[[str], object]) -> None:
+    """같은 디렉토리의 임시 파일에 쓴 뒤 os.replace로 교체
+
+    읽는 쪽이 반쯤 쓰인 파일을 보지 않도록 함 (임시 파일명은 프로세스/스레드별)
+    """
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _fast_date_range(path: str) -> DataRange | None:
+    """일봉 CSV의 헤더와 첫/마지막 행으로 데이터 보유 기간 계산
+
+    일봉은 날짜순으로 정렬되어 있으므로 날짜는 첫/마지막 행만 변환
+    (최신 날짜가 먼저 오는 파일도 있어 둘 중 작은/큰 값을 사용).
+    행 수는 빈 줄을 제외하고 세므로 파일 전체를 한 번 순회함
+    """
+    with open(path, "rb") as f:
+        # 빈 줄 제외 (pd.read_csv의 skip_blank_lines와 동일)
+        lines = (line for line in f if line.strip())
+
+        header = _read_csv_row(next(lines, b""))
+        if "date" not in header:
+            return None
+        col = header.index("date")
+
+        first = next(lines, None)
+        if first is None:
+            return None
+
+        last = first
+        days = 1
+        for last in lines:
+            days += 1
+
+    dates = pd.to_datetime([_read_csv_row(first)[col], _read_csv_row(last)[col]])
+    return DataRange(
+        start=dates.min().strftime("%Y-%m-%d"),
+        end=dates.max().strftime("%Y-%m-%d"),
+        days=days,
+    )
+
+
+@lru_cache(maxsize=4096)
+def _data_range_cached(path: str, mtime: float) -> DataRange | None:
+    """일봉 CSV 데이터 보유 기간 (경로/수정시간 기준 캐시)"""
+    return _fast_date_range(path)
+
+
+class PrefixIndex:
+    """정렬된 키 기반 접두어 인덱스
+
+    trie와 같은 접두어 조회를 정렬 배열 이진 탐색으로 처리 (O(log N + k))
+    """
+
+    def __init__(self, columns: list[np.ndarray]):
+        """같은 길이의 키 배열(컬럼별)로 인덱스 생성, 빈 키는 제외"""
+        n = len(columns[0]) if columns else 0
+        keys = np.concatenate(columns) if columns else np.array([], dtype=str)
+        rows = np.tile(np.arange(n), len(columns))
+
+        keep = keys != ""
+        keys, rows = keys[keep], rows[keep]
+        order = np.argsort(keys, kind="stable")
+        self._keys = keys[order]
+        self._rows = rows[order]
+
+    def lookup(self, prefix: str) -> set[int]:
+        """접두어로 시작하는 키의 행 번호 반환"""
+        lo = np.searchsorted(self._keys, prefix, side="left")
+        hi = np.searchsorted(self._keys, prefix + "\U0010ffff", side="left")
+        return set(self._rows[lo:hi].tolist())
+
+
 class MasterService:
     """마스터파일 관리 및 종목 검색 서비스"""
 
@@ -125,6 +216,12 @@ class MasterService:
         "amex": {"name": "아멕스", "country": "US", "type": "overseas"},
     }
 
+    # 종목 검색 대상 컬럼
+    SEARCH_COLUMNS = ("short_code", "korean_name", "english_name")
+
+    # 검색/조회 결과에 쓰는 컬럼
+    RESULT_COLUMNS = ("short_code", "korean_name", "english_name", "sector")
+
     # 마스터파일 URL 및 파싱 설정
     MASTER_CONFIG = {
         "kospi": {
@@ -165,6 +262,15 @@ class MasterService:
         },
     }
 
+    # 거래소 ID 목록 (순회용)
+    _EXCHANGE_IDS = tuple(MASTER_CONFIG.keys())
+
+    # 거래소 ID → ExchangeInfo
+    _EXCHANGE_INFO = {
+        ex_id: ExchangeInfo(id=ex_id, name=info["name"], country=info["country"])
+        for ex_id, info in EXCHANGES.items()
+    }
+
     def __init__(self, base_dir: str = "."):
         """서비스 초기화"""
         self.base_dir = base_dir
@@ -172,6 +278,15 @@ class MasterService:
         self.data_dir = os.path.join(base_dir, self.DATA_DIR)
         self._ensure_dirs()
         self._cache: dict[str, pd.DataFrame] = {}
+        # 거래소별 접두어 검색 인덱스
+        self._index: dict[str, PrefixIndex] = {}
+        # 거래소별 소문자 검색 컬럼 (고정 폭 유니코드 배열)
+        self._lower: dict[str, list[np.ndarray]] = {}
+        # 거래소별 종목코드(대문자) → 행 번호
+        self._code_index: dict[str, dict[str, int]] = {}
+        # 거래소별 결과 컬럼 값 (행 번호로 바로 조회)
+        self._values: dict[str, dict[str, list]] = {}
+        self._client: httpx.AsyncClient | None = None
 
     def _ensure_dirs(self):
         """필요한 디렉토리 생성"""
@@ -182,6 +297,29 @@ class MasterService:
         """CSV 파일 경로 반환"""
         return os.path.join(self.master_dir, f"{exchange}.csv")
 
+    def _get_pickle_path(self, exchange: str) -> str:
+        """pickle 캐시 파일 경로 반환
+
+        pickle 로드는 임의 코드를 실행할 수 있으므로 마스터 디렉토리
+        (HANTOO_DATA_DIR/.master)는 서버 프로세스만 쓸 수 있어야 함
+        """
+        return os.path.join(self.master_dir, f"{exchange}.pkl")
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """공유 HTTP 클라이언트 반환 (keep-alive 연결 재사용)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=60.0,
+                limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+            )
+        return self._client
+
+    async def aclose(self):
+        """HTTP 클라이언트 종료"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     def _get_file_mtime(self, path: str) -> datetime | None:
         """파일 수정 시간 반환"""
         if os.path.exists(path):
@@ -204,7 +342,7 @@ class MasterService:
         exchanges = {}
         needs_update = False
 
-        for ex_id in self.MASTER_CONFIG.keys():
+        for ex_id in self._EXCHANGE_IDS:
             csv_path = self._get_csv_path(ex_id)
             file_exists = os.path.exists(csv_path)
             mtime = self._get_file_mtime(csv_path)
@@ -237,13 +375,8 @@ class MasterService:
         domestic = []
         overseas = []
 
-        for ex_id, info in self.EXCHANGES.items():
-            ex_info = ExchangeInfo(
-                id=ex_id,
-                name=info["name"],
-                country=info["country"],
-            )
-            if info["type"] == "domestic":
+        for ex_id, ex_info in self._EXCHANGE_INFO.items():
+            if self.EXCHANGES[ex_id]["type"] == "domestic":
                 domestic.append(ex_info)
             else:
                 overseas.append(ex_info)
@@ -257,33 +390,37 @@ class MasterService:
     ) -> MasterUpdateResponse:
         """마스터파일 업데이트"""
         if exchanges is None:
-            exchanges = list(self.MASTER_CONFIG.keys())
+            exchanges = list(self._EXCHANGE_IDS)
 
         updated = []
         counts = {}
         errors = {}
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            for ex_id in exchanges:
-                if ex_id not in self.MASTER_CONFIG:
-                    errors[ex_id] = f"Unknown exchange: {ex_id}"
-                    continue
-
-                try:
-                    df = await self._download_and_parse(client, ex_id)
-                    csv_path = self._get_csv_path(ex_id)
-                    df.to_csv(csv_path, index=False, encoding="utf-8-sig")
+        # 중복 ID는 한 번만 갱신 (같은 파일 동시 쓰기 방지)
+        targets = []
+        for ex_id in dict.fromkeys(exchanges):
+            if ex_id not in self.MASTER_CONFIG:
+                errors[ex_id] = f"Unknown exchange: {ex_id}"
+                continue
+            targets.append(ex_id)
 
-                    # 캐시 갱신
-                    self._cache[ex_id] = df
+        # 거래소별 다운로드/파싱/저장을 동시에 실행
+        client = self._get_client()
+        tasks = [
+            asyncio.create_task(self._update_exchange(client, ex_id))
+            for ex_id in targets
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
 
-                    updated.append(ex_id)
-                    counts[ex_id] = len(df)
-                    logger.info(f"Updated {ex_id} master: {len(df)} symbols")
+        for ex_id, result in zip(targets, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to update {ex_id}: {result}")
+                errors[ex_id] = str(result)
+                continue
 
-                except Exception as e:
-                    logger.error(f"Failed to update {ex_id}: {e}")
-                    errors[ex_id] = str(e)
+            updated.append(ex_id)
+            counts[ex_id] = result
+            logger.info(f"Updated {ex_id} master: {result} symbols")
 
         return MasterUpdateResponse(
             success=len(errors) == 0,
@@ -292,158 +429,151 @@ class MasterService:
             errors=errors if errors else None,
         )
 
+    async def _update_exchange(self, client: httpx.AsyncClient, exchange: str) -> int:
+        """거래소 마스터파일 갱신 후 종목 수 반환"""
+        df = await self._download_and_parse(client, exchange)
+        index = await asyncio.to_thread(self._save_master, exchange, df)
+
+        # 캐시 갱신
+        self._set_cache(exchange, df, index)
+        return len(df)
+
+    def _save_master(self, exchange: str, df: pd.DataFrame) -> tuple:
+        """마스터 CSV 저장 후 검색 인덱스 생성"""
+        csv_path = self._get_csv_path(exchange)
+        _write_replace(
+            csv_path, lambda path: df.to_csv(path, index=False, encoding="utf-8-sig")
+        )
+
+        # pickle은 캐시일 뿐이므로 실패해도 갱신은 성공으로 처리
+        pickle_path = self._get_pickle_path(exchange)
+        try:
+            _write_replace(pickle_path, df.to_pickle)
+        except Exception as e:
+            logger.warning(f"Failed to write {exchange} pickle cache: {e}")
+            # 이전 pickle이 새 CSV 대신 로드되지 않도록 제거
+            if os.path.exists(pickle_path):
+                try:
+                    os.remove(pickle_path)
+                except OSError:
+                    pass
+
+        return self._build_index(df)
+
     async def _download_and_parse(
         self, client: httpx.AsyncClient, exchange: str
     ) -> pd.DataFrame:
         """마스터파일 다운로드 및 파싱"""
         config = self.MASTER_CONFIG[exchange]
         url = config["url"]
-        parser_name = config["parser"]
 
-        # 다운로드
+        # 다운로드 (메모리 버퍼로 스트리밍)
         logger.info(f"Downloading {exchange} master from {url}")
-        response = await client.get(url)
-        response.raise_for_status()
-
-        # ZIP 압축 해제
-        temp_zip = os.path.join(self.master_dir, f"{exchange}_temp.zip")
-        temp_mst = os.path.join(self.master_dir, f"{exchange}_temp.mst")
-
-        try:
-            with open(temp_zip, "wb") as f:
-                f.write(response.content)
-
-            with zipfile.ZipFile(temp_zip, "r") as zf:
-                # 첫 번째 파일 추출
-                extracted = zf.namelist()[0]
-                zf.extract(extracted, self.master_dir)
-                extracted_path = os.path.join(self.master_dir, extracted)
-
-                # 이름 변경
-                if extracted_path != temp_mst:
-                    if os.path.exists(temp_mst):
-                        os.remove(temp_mst)
-                    os.rename(extracted_path, temp_mst)
-
-            # 파싱
-            parser = getattr(self, parser_name)
-            df = parser(temp_mst, exchange)
-
-            return df
-
-        finally:
-            # 임시 파일 정리
-            for f in [temp_zip, temp_mst]:
-                if os.path.exists(f):
-                    os.remove(f)
+        buf = io.BytesIO()
+        async with client.stream("GET", url) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(65536):
+                buf.write(chunk)
+
+        # 압축 해제 및 파싱은 이벤트 루프 밖에서 실행
+        return await asyncio.to_thread(self._parse_archive, buf, exchange)
+
+    def _parse_archive(self, buf: io.BytesIO, exchange: str) -> pd.DataFrame:
+        """ZIP 압축 해제 후 마스터파일 파싱"""
+        # ZIP 압축 해제 (첫 번째 파일)
+        with zipfile.ZipFile(buf) as zf:
+            with zf.open(zf.infolist()[0]) as inner:
+                data = inner.read()
+
+        # 파싱
+        parser = getattr(self, self.MASTER_CONFIG[exchange]["parser"])
+        return parser(data, exchange)
 
     # ============== 파싱 메서드 ==============
 
-    def _read_file_content(self, file_path: str) -> str:
-        """여러 인코딩으로 파일 읽기 시도"""
-        encodings = ["cp949", "euc-kr", "utf-8", "utf-8-sig"]
+    def _read_file_content(self, raw: bytes) -> str:
+        """여러 인코딩으로 디코딩 시도 (메모리 내 바이트 재사용)"""
+        # BOM이 있으면 UTF-8로 바로 디코딩
+        if raw.startswith(codecs.BOM_UTF8):
+            return raw.decode("utf-8-sig")
+
+        encodings = ["cp949", "euc-kr", "utf-8"]
         for enc in encodings:
             try:
-                with open(file_path, "r", encoding=enc) as f:
-                    return f.read()
+                return raw.decode(enc)
             except UnicodeDecodeError:
                 continue
         raise ValueError("Failed to decode file with any encoding")
 
-    def _parse_kospi(self, file_path: str, exchange: str) -> pd.DataFrame:
-        """코스피 마스터파일 파싱"""
-        content = self._read_file_content(file_path)
+    def _build_domestic_frame(
+        self,
+        short_codes: list[str],
+        standard_codes: list[str],
+        names: list[str],
+        exchange: str,
+    ) -> pd.DataFrame:
+        """국내 마스터 DataFrame 구성 (컬럼 리스트로 한 번에 생성)"""
+        return pd.DataFrame(
+            {
+                "short_code": short_codes,
+                "standard_code": standard_codes,
+                "korean_name": names,
+                "exchange": exchange,
+                "sector": None,
+            }
+        )
 
-        data = []
+    def _parse_fixed_tail(
+        self, raw: bytes, exchange: str, tail_len: int
+    ) -> pd.DataFrame:
+        """뒷부분 고정 길이 마스터파일 파싱 (코스피/코스닥 공통)"""
+        content = self._read_file_content(raw)
+
+        short_codes, standard_codes, names = [], [], []
         for row in content.splitlines():
-            if len(row) < 230:
+            if len(row) < tail_len + 2:
                 continue
 
             # 앞부분: 단축코드, 표준코드, 한글명
-            front = row[: len(row) - 228]
-            short_code = front[0:9].strip()
-            standard_code = front[9:21].strip()
-            korean_name = front[21:].strip()
-
-            data.append(
-                {
-                    "short_code": short_code,
-                    "standard_code": standard_code,
-                    "korean_name": korean_name.replace(" ", ""),
-                    "exchange": exchange,
-                    "sector": None,
-                }
-            )
-
-        return pd.DataFrame(data)
-
-    def _parse_kosdaq(self, file_path: str, exchange: str) -> pd.DataFrame:
-        """코스닥 마스터파일 파싱"""
-        content = self._read_file_content(file_path)
+            front = row[:-tail_len]
+            short_codes.append(front[0:9].strip())
+            standard_codes.append(front[9:21].strip())
+            names.append(front[21:].strip().replace(" ", ""))
 
-        data = []
-        for row in content.splitlines():
-            if len(row) < 224:
-                continue
+        return self._build_domestic_frame(short_codes, standard_codes, names, exchange)
 
-            # 앞부분: 단축코드, 표준코드, 한글명
-            front = row[: len(row) - 222]
-            short_code = front[0:9].strip()
-            standard_code = front[9:21].strip()
-            korean_name = front[21:].strip()
-
-            data.append(
-                {
-                    "short_code": short_code,
-                    "standard_code": standard_code,
-                    "korean_name": korean_name.replace(" ", ""),
-                    "exchange": exchange,
-                    "sector": None,
-                }
-            )
+    def _parse_kospi(self, raw: bytes, exchange: str) -> pd.DataFrame:
+        """코스피 마스터파일 파싱"""
+        return self._parse_fixed_tail(raw, exchange, 228)
 
-        return pd.DataFrame(data)
+    def _parse_kosdaq(self, raw: bytes, exchange: str) -> pd.DataFrame:
+        """코스닥 마스터파일 파싱"""
+        return self._parse_fixed_tail(raw, exchange, 222)
 
-    def _parse_konex(self, file_path: str, exchange: str) -> pd.DataFrame:
+    def _parse_konex(self, raw: bytes, exchange: str) -> pd.DataFrame:
         """코넥스 마스터파일 파싱"""
-        content = self._read_file_content(file_path)
+        content = self._read_file_content(raw)
 
-        data = []
+        short_codes, standard_codes, names = [], [], []
         for row in content.splitlines():
             row = row.strip()
             if len(row) < 50:
                 continue
 
-            short_code = row[0:9].strip()
-            standard_code = row[9:21].strip()
-            stock_name = row[21:-184].strip() if len(row) > 205 else row[21:].strip()
-
-            data.append(
-                {
-                    "short_code": short_code,
-                    "standard_code": standard_code,
-                    "korean_name": stock_name.replace(" ", ""),
-                    "exchange": exchange,
-                    "sector": None,
-                }
-            )
+            short_codes.append(row[0:9].strip())
+            standard_codes.append(row[9:21].strip())
+            stock_name = row[21:-184] if len(row) > 205 else row[21:]
+            names.append(stock_name.strip().replace(" ", ""))
 
-        return pd.DataFrame(data)
+        return self._build_domestic_frame(short_codes, standard_codes, names, exchange)
 
-    def _parse_overseas(self, file_path: str, exchange: str) -> pd.DataFrame:
+    def _parse_overseas(self, raw: bytes, exchange: str) -> pd.DataFrame:
         """해외주식 마스터파일 파싱 (탭 구분)"""
-        encodings = ["cp949", "euc-kr", "utf-8"]
-        df = None
-
-        for enc in encodings:
-            try:
-                df = pd.read_csv(file_path, sep="\t", encoding=enc, dtype=str)
-                break
-            except Exception:
-                continue
-
-        if df is None:
-            raise ValueError("Failed to parse overseas master file")
+        content = self._read_file_content(raw)
+        try:
+            df = pd.read_csv(io.StringIO(content), sep="\t", dtype=str)
+        except Exception as e:
+            raise ValueError("Failed to parse overseas master file") from e
 
         # 컬럼명 매핑
         columns = [
@@ -503,11 +633,93 @@ class MasterService:
         if not os.path.exists(csv_path):
             return pd.DataFrame()
 
-        df = pd.read_csv(csv_path, dtype=str)
+        # CSV보다 최신인 pickle이 있으면 파싱 없이 로드
+        pickle_path = self._get_pickle_path(exchange)
+        pickle_mtime = self._get_file_mtime(pickle_path)
+        df = None
+        if pickle_mtime is not None and pickle_mtime >= self._get_file_mtime(csv_path):
+            try:
+                df = pd.read_pickle(pickle_path)
+            except Exception as e:
+                logger.warning(f"Failed to load {exchange} pickle cache: {e}")
+
+        if df is None:
+            df = pd.read_csv(csv_path, dtype=str)
+
+            # 다음 재시작부터 CSV 파싱을 건너뛰도록 pickle 생성
+            try:
+                _write_replace(pickle_path, df.to_pickle)
+            except Exception as e:
+                logger.warning(f"Failed to write {exchange} pickle cache: {e}")
+
         df = df.fillna("")
-        self._cache[exchange] = df
+        self._set_cache(exchange, df)
         return df
 
+    def _build_index(self, df: pd.DataFrame) -> tuple:
+        """검색 인덱스 생성 (접두어, 소문자 컬럼, 코드 인덱스, 결과 컬럼 값)"""
+        lower = [
+            df[col].fillna("").str.lower().to_numpy(dtype=str)
+            for col in self.SEARCH_COLUMNS
+            if col in df.columns
+        ]
+
+        # 같은 코드가 여러 행이면 첫 행 사용 (역순으로 넣어 앞 행이 남도록)
+        codes = df["short_code"].fillna("").str.upper().tolist()
+        code_index = dict(zip(reversed(codes), range(len(codes) - 1, -1, -1)))
+
+        values = {
+            col: df[col].tolist() for col in self.RESULT_COLUMNS if col in df.columns
+        }
+
+        return PrefixIndex(lower), lower, code_index, values
+
+    def _set_cache(self, exchange: str, df: pd.DataFrame, index: tuple | None = None):
+        """캐시 및 검색 인덱스 저장
+
+        검색과 같은 스레드에서 await 없이 호출해 DataFrame과 인덱스를 함께 교체
+        """
+        if index is None:
+            index = self._build_index(df)
+        prefix_index, lower, code_index, values = index
+
+        self._index[exchange] = prefix_index
+        self._lower[exchange] = lower
+        self._code_index[exchange] = code_index
+        self._values[exchange] = values
+        self._cache[exchange] = df
+
+    def _rank_matches(
+        self, frames: dict[str, pd.DataFrame], q_lower: str, limit: int
+    ) -> list[tuple[str, int]]:
+        """검색어와 일치하는 (거래소, 행 번호)를 순위대로 최대 limit개 반환
+
+        접두어 일치를 먼저, 나머지 부분 일치를 그 다음에 두고,
+        각 단계 안에서는 거래소 순서와 행 순서를 따름
+        """
+        hits: list[tuple[str, int]] = []
+        prefix_rows: dict[str, list[int]] = {}
+
+        # 접두어 일치는 인덱스로 조회
+        for ex_id in frames:
+            prefix = sorted(self._index[ex_id].lookup(q_lower))
+            hits.extend((ex_id, i) for i in prefix)
+            prefix_rows[ex_id] = prefix
+
+        # 부족하면 나머지 부분 일치를 위해 코드/이름/영문명 전체 검색
+        for ex_id, df in frames.items():
+            if len(hits) >= limit:
+                break
+
+            mask = np.zeros(len(df), dtype=bool)
+            for col in self._lower[ex_id]:
+                mask |= np.char.find(col, q_lower) >= 0
+
+            mask[prefix_rows[ex_id]] = False
+            hits.extend((ex_id, i) for i in np.flatnonzero(mask).tolist())
+
+        return hits[:limit]
+
     def _get_data_range(self, code: str) -> DataRange | None:
         """종목의 데이터 보유 기간 확인"""
         # 국내/해외 데이터 디렉토리 모두 확인
@@ -515,25 +727,32 @@ class MasterService:
             data_path = os.path.join(data_dir, f"{code}.csv")
             if os.path.exists(data_path):
                 try:
-                    df = pd.read_csv(data_path)
-                    if "date" in df.columns and len(df) > 0:
-                        dates = pd.to_datetime(df["date"])
-                        return DataRange(
-                            start=dates.min().strftime("%Y-%m-%d"),
-                            end=dates.max().strftime("%Y-%m-%d"),
-                            days=len(df),
-                        )
+                    mtime = os.path.getmtime(data_path)
+                    data_range = _data_range_cached(data_path, mtime)
+                    if data_range is not None:
+                        return data_range
                 except Exception:
                     pass
         return None
 
+    def _column_value(self, exchange: str, col: str, i: int) -> str | None:
+        """위치별 컬럼 값 반환 (컬럼이 없거나 빈 값이면 None)"""
+        values = self._values[exchange].get(col)
+        if values is None:
+            return None
+        value = values[i]
+        return value if isinstance(value, str) and value else None
+
     def search_symbols(
         self,
         q: str,
         exchange: Optional[str] = None,
         limit: int = 20,
     ) -> SymbolSearchResult:
-        """종목 검색"""
+        """종목 검색
+
+        결과는 접두어 일치, 나머지 부분 일치 순으로 정렬
+        """
         results = []
         q_lower = q.lower().strip()
 
@@ -541,45 +760,31 @@ class MasterService:
         if exchange:
             exchanges = [exchange] if exchange in self.MASTER_CONFIG else []
         else:
-            exchanges = list(self.MASTER_CONFIG.keys())
+            exchanges = list(self._EXCHANGE_IDS)
 
+        frames = {}
         for ex_id in exchanges:
             df = self._load_csv(ex_id)
-            if df.empty:
-                continue
-
-            # 코드 또는 이름으로 검색
-            mask = df["short_code"].str.lower().str.contains(
-                q_lower, na=False
-            ) | df["korean_name"].str.lower().str.contains(q_lower, na=False)
-
-            # 영문명이 있으면 추가 검색
-            if "english_name" in df.columns:
-                mask |= df["english_name"].str.lower().str.contains(q_lower, na=False)
-
-            matched = df[mask]
-
-            for _, row in matched.iterrows():
-                code = row["short_code"]
-                data_range = self._get_data_range(code)
-
-                results.append(
-                    SymbolSearchItem(
-                        code=code,
-                        name=row["korean_name"],
-                        exchange=ex_id,
-                        exchange_name=self.EXCHANGES[ex_id]["name"],
-                        sector=row.get("sector") if row.get("sector") else None,
-                        has_data=data_range is not None,
-                        data_range=data_range,
-                    )
+            if not df.empty:
+                frames[ex_id] = df
+
+        # 일치 행만 위치 기반으로 조회
+        for ex_id, i in self._rank_matches(frames, q_lower, limit):
+            values = self._values[ex_id]
+            code = values["short_code"][i]
+            data_range = self._get_data_range(code)
+
+            results.append(
+                SymbolSearchItem(
+                    code=code,
+                    name=values["korean_name"][i],
+                    exchange=ex_id,
+                    exchange_name=self._EXCHANGE_INFO[ex_id].name,
+                    sector=self._column_value(ex_id, "sector", i),
+                    has_data=data_range is not None,
+                    data_range=data_range,
                 )
-
-                if len(results) >= limit:
-                    break
-
-            if len(results) >= limit:
-                break
+            )
 
         return SymbolSearchResult(
             query=q,
@@ -592,25 +797,24 @@ class MasterService:
         """종목 상세 정보 조회"""
         code = code.upper().strip()
 
-        for ex_id in self.MASTER_CONFIG.keys():
+        for ex_id in self._EXCHANGE_IDS:
             df = self._load_csv(ex_id)
             if df.empty:
                 continue
 
-            matched = df[df["short_code"].str.upper() == code]
-            if len(matched) > 0:
-                row = matched.iloc[0]
+            i = self._code_index[ex_id].get(code)
+            if i is not None:
                 data_range = self._get_data_range(code)
 
+                values = self._values[ex_id]
+
                 return SymbolDetail(
-                    code=row["short_code"],
-                    name=row["korean_name"],
-                    english_name=(
-                        row.get("english_name") if row.get("english_name") else None
-                    ),
+                    code=values["short_code"][i],
+                    name=values["korean_name"][i],
+                    english_name=self._column_value(ex_id, "english_name", i),
                     exchange=ex_id,
-                    exchange_name=self.EXCHANGES[ex_id]["name"],
-                    sector=row.get("sector") if row.get("sector") else None,
+                    exchange_name=self._EXCHANGE_INFO[ex_id].name,
+                    sector=self._column_value(ex_id, "sector", i),
                     listing_date=None,
                     market_cap_scale=None,
                     has_data=data_range is not None,
@@ -630,3 +834,9 @@ def get_master_service(base_dir: str = ".") -> MasterService:
     if _master_service is None:
         _master_service = MasterService(base_dir)
     return _master_service
+
+
+async def close_master_service():
+    """MasterService 싱글톤 자원 정리 (프로세스 종료 시 호출)"""
+    if _master_service is not None:
+        await _master_service.aclose()